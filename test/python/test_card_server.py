@@ -179,4 +179,4 @@ for socket in sockets:
 for socket in sockets:
     socket.close()
 
-zmqctx.destroy()
+zmqctx.term()